@@ -19,6 +19,7 @@ import timeit
 import warnings
 
 from bson import ObjectId
+import numpy as np
 from pymongo import InsertOne, UpdateOne, UpdateMany
 
 import eta.core.serial as etas
@@ -2149,8 +2150,11 @@ class SampleCollection(object):
                 sample) or a dict mapping frame numbers to values. If
                 ``field_name`` contains array fields, the corresponding
                 elements of ``values`` must be arrays of the same lengths. This
-                argument can also be a dict mapping keys to values (each value
-                as described previously), in which case the keys are used to
+                argument can also be a numpy array, in which case 1D numeric
+                arrays are efficiently converted to native Python values and
+                each row of a multidimensional array is used as an array
+                value, or a dict mapping keys to values (each value as
+                described previously), in which case the keys are used to
                 match samples by their ``key_field``
             key_field (None): a key field to use when choosing which samples to
                 update when ``values`` is a dict
@@ -2201,6 +2205,16 @@ class SampleCollection(object):
                 "(found: '%s')" % field_name
             )
 
+        if (
+            isinstance(values, np.ndarray)
+            and values.ndim == 1
+            and values.dtype != object
+        ):
+            # Converts numpy scalars to native types in a single C-level pass.
+            # Multidimensional arrays are left as-is so that each row remains
+            # an array, e.g., when setting vector fields
+            values = values.tolist()
+
         if isinstance(values, dict):
             if key_field is None:
                 raise ValueError(
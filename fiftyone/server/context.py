@@ -15,7 +15,11 @@ import strawberry.asgi as gqla
 from fiftyone.core.odm import get_async_db_conn
 
 from fiftyone.server.data import Context
-from fiftyone.server.dataloader import dataloaders, get_dataloader
+from fiftyone.server.dataloader import (
+    dataloaders,
+    get_dataloader,
+    get_runs_dataloader,
+)
 
 
 def get_context(
@@ -29,7 +33,11 @@ def get_context(
         loaders[cls] = get_dataloader(cls, config, db)
 
     return Context(
-        db=db, dataloaders=loaders, request=request, response=response
+        db=db,
+        dataloaders=loaders,
+        runs_loader=get_runs_dataloader(db),
+        request=request,
+        response=response,
     )
 
 
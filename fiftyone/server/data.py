@@ -21,7 +21,11 @@ T = t.TypeVar("T")
 @dataclass
 class Context:
     db: mtr.AsyncIOMotorDatabase
-    dataloaders: t.Dict[t.Type[t.Any], DataLoader[str, t.Type[t.Any]]]
+    dataloaders: t.Dict[
+        t.Type[t.Any],
+        DataLoader[t.Tuple[str, t.FrozenSet[str]], t.Type[t.Any]],
+    ]
+    runs_loader: DataLoader[t.Any, t.List[dict]]
     request: strq.Request
     response: strp.Response
 
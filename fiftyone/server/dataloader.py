@@ -5,14 +5,16 @@ FiftyOne Server dataloader
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import defaultdict
 from dataclasses import dataclass
 import typing as t
 
+from bson import ObjectId
 import motor.motor_asyncio as mtr
 from strawberry.dataloader import DataLoader
 
 from fiftyone.server.data import Info, T
-from fiftyone.server.utils import from_dict
+from fiftyone.server.utils import from_dict, get_excluded_fields
 
 
 @dataclass
@@ -25,23 +27,32 @@ class DataLoaderConfig:
 
 dataloaders: t.Dict[type, DataLoaderConfig] = {}
 
+RUNS_COLLECTION = "runs"
+
 
 def get_dataloader(
     cls: t.Type[T],
     config: DataLoaderConfig,
     db: mtr.AsyncIOMotorDatabase,
-) -> DataLoader[str, t.Optional[T]]:
+) -> DataLoader[t.Tuple[str, t.FrozenSet[str]], t.Optional[T]]:
     async def load_items(
-        keys: t.List[str],
+        keys: t.List[t.Tuple[str, t.FrozenSet[str]]],
     ) -> t.List[t.Optional[T]]:
         results = {}
         if config.key == "id":
             config.key = "_id"
+
+        names = [name for name, _ in keys]
         find_params = [
-            {"$and": [{config.key: {"$in": keys}}] + config.filters}
+            {"$and": [{config.key: {"$in": names}}] + config.filters}
         ]
-        if config.projections:
-            find_params.append(config.projections)
+
+        # Only omit fields that no load in this batch requires
+        excluded = frozenset.intersection(*(e for _, e in keys))
+        projections = dict(config.projections or {})
+        projections.update({f: False for f in excluded})
+        if projections:
+            find_params.append(projections)
 
         async for doc in db[config.collection].find(*find_params):
             results[doc[config.key]] = doc
@@ -50,10 +61,12 @@ def get_dataloader(
             if not doc:
                 return None
 
-            doc = cls.modifier(doc)
+            # The same doc may be built for multiple keys, and modifiers
+            # update docs in place
+            doc = cls.modifier(dict(doc))
             return from_dict(cls, doc)
 
-        return [build(results.get(k, None)) for k in keys]
+        return [build(results.get(name, None)) for name in names]
 
     return DataLoader(load_fn=load_items)
 
@@ -73,7 +86,39 @@ def get_dataloader_resolver(
     )
 
     async def resolver(name: str, info: Info) -> t.Awaitable[t.Optional[T]]:
-        return await info.context.dataloaders[cls].load(name)
+        excluded = get_excluded_fields(cls, info)
+        return await info.context.dataloaders[cls].load((name, excluded))
 
     resolver.__annotations__[key] = resolver.__annotations__.pop("name")
     return resolver
+
+
+def get_runs_dataloader(
+    db: mtr.AsyncIOMotorDatabase,
+) -> DataLoader[ObjectId, t.List[dict]]:
+    async def load_items(keys: t.List[ObjectId]) -> t.List[t.List[dict]]:
+        results = defaultdict(list)
+        async for doc in db[RUNS_COLLECTION].find(
+            {"_dataset_id": {"$in": keys}}
+        ):
+            results[doc["_dataset_id"]].append(doc)
+
+        return [results.get(k, []) for k in keys]
+
+    return DataLoader(load_fn=load_items)
+
+
+async def load_runs(
+    info: Info,
+    dataset_id: ObjectId,
+    run_ids: t.List[ObjectId],
+    preloaded: t.Optional[t.Dict[ObjectId, dict]] = None,
+) -> t.List[dict]:
+    if preloaded is not None and all(_id in preloaded for _id in run_ids):
+        return [preloaded[_id] for _id in run_ids]
+
+    # Runs are batch-loaded by dataset, so sibling datasets in the same
+    # request share a single query
+    docs = await info.context.runs_loader.load(dataset_id)
+    docs = {doc["_id"]: doc for doc in docs}
+    return [docs[_id] for _id in run_ids if _id in docs]
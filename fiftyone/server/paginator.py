@@ -17,7 +17,7 @@ import fiftyone.core.odm as foo
 
 from fiftyone.server.constants import LIST_LIMIT
 from fiftyone.server.data import Info, T
-from fiftyone.server.utils import from_dict
+from fiftyone.server.utils import from_dict, get_excluded_fields
 
 C = t.TypeVar("C")
 
@@ -51,6 +51,7 @@ async def get_items(
     search: str,
     first: int = LIST_LIMIT,
     after: t.Optional[str] = UNSET,
+    excluded: t.Optional[t.Iterable[str]] = None,
 ) -> Connection[T, str]:
     start = list(filters)
     first = first or LIST_LIMIT
@@ -62,8 +63,12 @@ async def get_items(
     if after:
         start += [{"$match": {"_id": {"$gt": ObjectId(after)}}}]
 
+    project = []
+    if excluded:
+        project.append({"$project": {f: False for f in excluded}})
+
     pipelines = [
-        start + [{"$limit": first + 1}],
+        start + [{"$limit": first + 1}] + project,
         start + [{"$count": "total"}],
     ]
 
@@ -113,6 +118,7 @@ def get_paginator_resolver(
             search,
             first,
             after,
+            excluded=get_excluded_fields(cls, info, path=["edges", "node"]),
         )
 
     return paginate
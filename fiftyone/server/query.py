@@ -12,6 +12,7 @@ from enum import Enum
 import logging
 import typing as t
 
+import cachetools
 import eta.core.utils as etau
 import strawberry as gql
 from bson import ObjectId, json_util
@@ -33,7 +34,7 @@ import fiftyone.server.aggregate as fosa
 from fiftyone.server.aggregations import aggregate_resolver
 from fiftyone.server.color import ColorBy, ColorScheme
 from fiftyone.server.data import Info
-from fiftyone.server.dataloader import get_dataloader_resolver
+from fiftyone.server.dataloader import get_dataloader_resolver, load_runs
 from fiftyone.server.events import get_state
 from fiftyone.server.indexes import Index, from_dict as indexes_from_dict
 from fiftyone.server.lightning import lightning_resolver
@@ -46,7 +47,7 @@ from fiftyone.server.samples import (
 )
 from fiftyone.server.scalars import BSON, BSONArray, JSON
 from fiftyone.server.stage_definitions import stage_definitions
-from fiftyone.server.utils import from_dict
+from fiftyone.server.utils import from_dict, get_excluded_fields
 from fiftyone.server.workspace import Workspace
 
 
@@ -58,6 +59,8 @@ ID = gql.scalar(
 DATASET_FILTER = [{"sample_collection_name": {"$regex": "^samples\\."}}]
 DATASET_FILTER_STAGE = [{"$match": DATASET_FILTER[0]}]
 
+_app_config_cache = cachetools.LRUCache(maxsize=1)
+
 
 @gql.type
 class Group:
@@ -244,10 +247,6 @@ class Dataset:
     parent_media_type: t.Optional[MediaType]
     mask_targets: t.List[NamedTargets]
     default_mask_targets: t.Optional[t.List[Target]]
-    sample_fields: t.List[SampleField]
-    frame_fields: t.Optional[t.List[SampleField]]
-    brain_methods: t.Optional[t.List[BrainRun]]
-    evaluations: t.Optional[t.List[EvaluationRun]]
     saved_view_slug: t.Optional[str]
     saved_views: t.Optional[t.List[SavedView]]
     version: t.Optional[str]
@@ -265,6 +264,45 @@ class Dataset:
 
     frame_collection_name: gql.Private[t.Optional[str]]
     sample_collection_name: gql.Private[t.Optional[str]]
+    brain_method_ids: gql.Private[t.List[ObjectId]]
+    evaluation_ids: gql.Private[t.List[ObjectId]]
+    run_docs: gql.Private[t.Dict[ObjectId, t.Dict]]
+    sample_field_docs: gql.Private[t.List[t.Dict]]
+    frame_field_docs: gql.Private[t.List[t.Dict]]
+    sample_field_schema: gql.Private[t.Optional[t.List[SampleField]]]
+    frame_field_schema: gql.Private[t.Optional[t.List[SampleField]]]
+
+    @gql.field
+    def sample_fields(self) -> t.List[SampleField]:
+        if self.sample_field_schema is not None:
+            return self.sample_field_schema
+
+        return _to_sample_fields(self.sample_field_docs)
+
+    @gql.field
+    def frame_fields(self) -> t.Optional[t.List[SampleField]]:
+        if self.frame_field_schema is not None:
+            return self.frame_field_schema
+
+        return _to_sample_fields(self.frame_field_docs)
+
+    @gql.field
+    async def brain_methods(
+        self, info: Info = None
+    ) -> t.Optional[t.List[BrainRun]]:
+        docs = await load_runs(
+            info, self.dataset_id, self.brain_method_ids, self.run_docs
+        )
+        return [from_dict(BrainRun, doc) for doc in docs]
+
+    @gql.field
+    async def evaluations(
+        self, info: Info = None
+    ) -> t.Optional[t.List[EvaluationRun]]:
+        docs = await load_runs(
+            info, self.dataset_id, self.evaluation_ids, self.run_docs
+        )
+        return [from_dict(EvaluationRun, doc) for doc in docs]
 
     @gql.field
     def stages(
@@ -317,12 +355,14 @@ class Dataset:
             NamedTargets(name=name, targets=_convert_targets(targets))
             for name, targets in doc.get("mask_targets", {}).items()
         ]
-        flat = _flatten_fields([], doc.get("sample_fields", []))
-        doc["sample_fields"] = flat
-
-        doc["frame_fields"] = _flatten_fields([], doc.get("frame_fields", []))
-        doc["brain_methods"] = list(doc.get("brain_methods", {}).values())
-        doc["evaluations"] = list(doc.get("evaluations", {}).values())
+        # Field docs are only flattened if their schema is resolved
+        doc["sample_field_docs"] = doc.pop("sample_fields", [])
+        doc["frame_field_docs"] = doc.pop("frame_fields", [])
+        brain_methods = doc.pop("brain_methods", {})
+        evaluations = doc.pop("evaluations", {})
+        doc["brain_method_ids"] = _get_run_ids(brain_methods)
+        doc["evaluation_ids"] = _get_run_ids(evaluations)
+        doc["run_docs"] = _get_run_docs(brain_methods, evaluations)
         doc["saved_views"] = doc.get("saved_views", [])
         doc["skeletons"] = list(
             dict(name=name, **data)
@@ -336,9 +376,25 @@ class Dataset:
 
         # gql private fields must always be present
         doc.setdefault("frame_collection_name", None)
+        doc.setdefault("sample_field_schema", None)
+        doc.setdefault("frame_field_schema", None)
 
         return doc
 
+    @staticmethod
+    def excluded_fields(selected: t.Set[str]) -> t.Set[str]:
+        # Field schemas can be large, so only load them when requested. Both
+        # camel and snake case selections are supported since the schema's
+        # `auto_camel_case` setting is configurable
+        excluded = set()
+        if not selected & {"sampleFields", "sample_fields"}:
+            excluded.add("sample_fields")
+
+        if not selected & {"frameFields", "frame_fields"}:
+            excluded.add("frame_fields")
+
+        return excluded
+
     @classmethod
     async def resolver(
         cls,
@@ -353,6 +409,7 @@ class Dataset:
             saved_view_slug=saved_view_slug,
             dicts=False,
             update_last_loaded_at=True,
+            excluded=get_excluded_fields(cls, info),
         )
 
 
@@ -415,7 +472,7 @@ class Query(fosa.AggregateQuery):
         config = get_state().config
         d = config.serialize()
         d["timezone"] = fo.config.timezone
-        return from_dict(AppConfig, d)
+        return _load_app_config(d)
 
     @gql.field
     def context(self) -> str:
@@ -555,29 +612,76 @@ class Query(fosa.AggregateQuery):
             )
 
 
+def _load_app_config(d: t.Dict) -> AppConfig:
+    # The App config rarely changes, so we cache the parsed config, keyed by
+    # its serialized contents since the underlying config may be edited
+    # in-place
+    key = json_util.dumps(d, sort_keys=True)
+    app_config = _app_config_cache.get(key, None)
+    if app_config is None:
+        app_config = from_dict(AppConfig, d)
+        _app_config_cache[key] = app_config
+
+    return app_config
+
+
 def _flatten_fields(
     path: t.List[str], fields: t.List[t.Dict]
 ) -> t.List[t.Dict]:
     result = []
-    for field in fields:
-        key = field.pop("name", None)
+    stack = [(path, iter(fields))]
+    while stack:
+        path, fields = stack[-1]
+        field = next(fields, None)
+        if field is None:
+            stack.pop()
+            continue
+
+        key = field.get("name", None)
         if key is None:
             # Issues with concurrency can cause this to happen.
             # Until it's fixed, just ignore these fields to avoid throwing hard
             # errors when loading in the app.
             logging.debug("Skipping field with no name: %s", field)
             continue
-        field_path = path + [key]
-        field["path"] = ".".join(field_path)
-        result.append(field)
 
-        fields = field.pop("fields", None)
-        if fields:
-            result = result + _flatten_fields(field_path, fields)
+        field_path = path + [key]
+        flat_field = {
+            k: v for k, v in field.items() if k not in ("name", "fields")
+        }
+        flat_field["path"] = ".".join(field_path)
+        result.append(flat_field)
+
+        # Descend into embedded fields before continuing with siblings so that
+        # the result is ordered depth-first
+        subfields = field.get("fields", None)
+        if subfields:
+            stack.append((field_path, iter(subfields)))
 
     return result
 
 
+def _to_sample_fields(fields: t.List[t.Dict]) -> t.List[SampleField]:
+    return [from_dict(SampleField, f) for f in _flatten_fields([], fields)]
+
+
+def _get_run_ids(runs: t.Dict) -> t.List[ObjectId]:
+    # Run references may have already been dereferenced into run dicts
+    return [
+        run["_id"] if isinstance(run, dict) else run for run in runs.values()
+    ]
+
+
+def _get_run_docs(*runs: t.Dict) -> t.Dict[ObjectId, t.Dict]:
+    # Runs that were already dereferenced need not be loaded again
+    return {
+        run["_id"]: run
+        for _runs in runs
+        for run in _runs.values()
+        if isinstance(run, dict)
+    }
+
+
 def _convert_targets(targets: t.Dict[str, str]) -> t.List[Target]:
     return [Target(target=k, value=v) for k, v in targets.items()]
 
@@ -588,6 +692,7 @@ async def serialize_dataset(
     saved_view_slug: t.Optional[str] = None,
     dicts=True,
     update_last_loaded_at=False,
+    excluded=None,
 ) -> Dataset:
     def run():
         if not fod.dataset_exists(dataset_name):
@@ -634,13 +739,18 @@ async def serialize_dataset(
 
             collection = view
 
-        data.sample_fields = serialize_fields(
-            collection.get_field_schema(flat=True)
-        )
+        # Only serialize the schemas that were requested
+        excluded_fields = excluded or ()
 
-        data.frame_fields = serialize_fields(
-            collection.get_frame_field_schema(flat=True)
-        )
+        if "sample_fields" not in excluded_fields:
+            data.sample_field_schema = serialize_fields(
+                collection.get_field_schema(flat=True)
+            )
+
+        if "frame_fields" not in excluded_fields:
+            data.frame_field_schema = serialize_fields(
+                collection.get_frame_field_schema(flat=True)
+            )
 
         if dicts:
             saved_views = []
@@ -652,32 +762,6 @@ async def serialize_dataset(
 
             data.saved_views = saved_views
 
-        for brain_method in data.brain_methods:
-            try:
-                type = brain_method.config.type().value
-            except:
-                type = None
-
-            try:
-                max_k = brain_method.config.max_k()
-            except:
-                max_k = None
-
-            try:
-                supports_least_similarity = (
-                    brain_method.config.supports_least_similarity()
-                )
-            except:
-                supports_least_similarity = None
-
-            setattr(brain_method.config, "type", type)
-            setattr(brain_method.config, "max_k", max_k)
-            setattr(
-                brain_method.config,
-                "supports_least_similarity",
-                supports_least_similarity,
-            )
-
         _assign_estimated_counts(data, dataset)
         _assign_lightning_info(data, dataset)
 
@@ -12,6 +12,7 @@ import cachetools
 from dacite import Config, from_dict as _from_dict
 from dacite.core import T
 from dacite.data import Data
+from strawberry.types.nodes import FragmentSpread, InlineFragment
 
 import fiftyone.core.dataset as fod
 import fiftyone.core.fields as fof
@@ -106,6 +107,59 @@ def from_dict(data_class: t.Type[T], data: Data) -> T:
     return _from_dict(data_class, data, config=_dacite_config)
 
 
+def get_selected_fields(info, path=None):
+    """Returns the names of the GraphQL fields selected on the type of the
+    field being resolved.
+
+    Args:
+        info: the GraphQL info
+        path (None): an optional list of nested field names, e.g.,
+            ``["edges", "node"]``, to traverse before collecting selections
+
+    Returns:
+        a set of (camel case) field names
+    """
+    fields = [
+        child
+        for field in info.selected_fields
+        for child in _expand_fragments(field.selections)
+    ]
+
+    for name in path or []:
+        fields = [
+            child
+            for field in fields
+            if field.name == name
+            for child in _expand_fragments(field.selections)
+        ]
+
+    return {field.name for field in fields}
+
+
+def get_excluded_fields(cls, info, path=None):
+    """Returns the database fields that the given type does not need to load
+    for the current GraphQL selection.
+
+    Types can opt into this by implementing an ``excluded_fields(selected)``
+    static method that maps the set of selected field names to the set of
+    database fields that can be omitted.
+
+    Args:
+        cls: the GraphQL type being resolved
+        info: the GraphQL info
+        path (None): an optional list of nested field names to traverse to
+            reach the selections of ``cls``
+
+    Returns:
+        a frozenset of database field names
+    """
+    if not hasattr(cls, "excluded_fields"):
+        return frozenset()
+
+    selected = get_selected_fields(info, path=path)
+    return frozenset(cls.excluded_fields(selected))
+
+
 def meets_type(field: fof.Field, type_or_types):
     """
     Determines whether the field meets type or types, or the field
@@ -121,6 +175,14 @@ def meets_type(field: fof.Field, type_or_types):
     )
 
 
+def _expand_fragments(selections):
+    for selection in selections:
+        if isinstance(selection, (FragmentSpread, InlineFragment)):
+            yield from _expand_fragments(selection.selections)
+        else:
+            yield selection
+
+
 def _parse_changes(changes):
     add_tags = []
     del_tags = []
@@ -60,9 +60,9 @@ class BaseEvaluationResults(foe.EvaluationResults):
 
         ytrue, ypred, classes = _parse_labels(ytrue, ypred, classes, missing)
 
-        self.ytrue = np.asarray(ytrue)
-        self.ypred = np.asarray(ypred)
-        self.confs = np.asarray(confs) if confs is not None else None
+        self.ytrue = np.asarray(ytrue, dtype=object)
+        self.ypred = np.asarray(ypred, dtype=object)
+        self.confs = _parse_confs(confs)
         self.weights = np.asarray(weights) if weights is not None else None
         self.ytrue_ids = (
             np.asarray(ytrue_ids) if ytrue_ids is not None else None
@@ -73,6 +73,12 @@ class BaseEvaluationResults(foe.EvaluationResults):
         self.classes = np.asarray(classes)
         self.missing = missing
 
+        # Integer-encode the labels once so that metrics can be computed
+        # without rehashing the raw labels on every call
+        self._label_codes = {}
+        self._ytrue_codes = _encode_labels(self.ytrue, self._label_codes)
+        self._ypred_codes = _encode_labels(self.ypred, self._label_codes)
+
     def report(self, classes=None):
         """Generates a classification report for the results via
         :func:`sklearn:sklearn.metrics.classification_report`.
@@ -104,10 +110,13 @@ class BaseEvaluationResults(foe.EvaluationResults):
             d["weighted avg"] = empty.copy()
             return d
 
+        ytrue, ypred = self._get_label_inds(labels)
+
         return skm.classification_report(
-            self.ytrue,
-            self.ypred,
-            labels=labels,
+            ytrue,
+            ypred,
+            labels=np.arange(labels.size),
+            target_names=["%s" % l for l in labels],
             sample_weight=self.weights,
             output_dict=True,
             zero_division=0,
@@ -130,24 +139,21 @@ class BaseEvaluationResults(foe.EvaluationResults):
             a dict
         """
         labels = self._parse_classes(classes)
+        ytrue, ypred = self._get_label_inds(labels)
 
-        accuracy = _compute_accuracy(
-            self.ytrue, self.ypred, labels=labels, weights=self.weights
-        )
+        accuracy = _compute_accuracy(ytrue, ypred, weights=self.weights)
 
         precision, recall, fscore, _ = skm.precision_recall_fscore_support(
-            self.ytrue,
-            self.ypred,
+            ytrue,
+            ypred,
             average=average,
-            labels=labels,
+            labels=np.arange(labels.size),
             beta=beta,
             sample_weight=self.weights,
             zero_division=0,
         )
 
-        support = _compute_support(
-            self.ytrue, labels=labels, weights=self.weights
-        )
+        support = _compute_support(ytrue, weights=self.weights)
 
         return {
             "accuracy": accuracy,
@@ -172,10 +178,13 @@ class BaseEvaluationResults(foe.EvaluationResults):
             print("No classes to analyze")
             return
 
+        ytrue, ypred = self._get_label_inds(labels)
+
         report_str = skm.classification_report(
-            self.ytrue,
-            self.ypred,
-            labels=labels,
+            ytrue,
+            ypred,
+            labels=np.arange(labels.size),
+            target_names=["%s" % l for l in labels],
             digits=digits,
             sample_weight=self.weights,
             zero_division=0,
@@ -285,6 +294,17 @@ class BaseEvaluationResults(foe.EvaluationResults):
 
         return np.array([c for c in self.classes if c != self.missing])
 
+    def _get_label_inds(self, labels):
+        # Maps the cached label codes to indexes into `labels`, or -1 for
+        # labels that do not appear in `labels`
+        code_inds = np.full(len(self._label_codes), -1, dtype=np.int64)
+        for idx, label in enumerate(labels):
+            code = self._label_codes.get(label, None)
+            if code is not None:
+                code_inds[code] = idx
+
+        return code_inds[self._ytrue_codes], code_inds[self._ypred_codes]
+
     def _confusion_matrix(
         self,
         classes=None,
@@ -311,18 +331,22 @@ class BaseEvaluationResults(foe.EvaluationResults):
         else:
             added_missing = False
 
+        ytrue, ypred = self._get_label_inds(labels)
+
         if include_other != False:
-            labels_set = set(labels + [self.missing])
-            ypred = [y if y in labels_set else other_label for y in self.ypred]
-            ytrue = [y if y in labels_set else other_label for y in self.ytrue]
-        else:
-            ypred = self.ypred
-            ytrue = self.ytrue
+            # Labels that are not in `labels` (and are not missing) are
+            # assigned to `other_label`
+            other_idx = labels.index(other_label)
+            missing_code = self._label_codes.get(self.missing, -1)
+            is_other = (ytrue < 0) & (self._ytrue_codes != missing_code)
+            ytrue[is_other] = other_idx
+            is_other = (ypred < 0) & (self._ypred_codes != missing_code)
+            ypred[is_other] = other_idx
 
         cmat, ids = _compute_confusion_matrix(
             ytrue,
             ypred,
-            labels,
+            len(labels),
             weights=self.weights,
             ytrue_ids=self.ytrue_ids,
             ypred_ids=self.ypred_ids,
@@ -390,29 +414,48 @@ class BaseEvaluationResults(foe.EvaluationResults):
 
 def _parse_labels(ytrue, ypred, classes, missing):
     if classes is None:
-        classes = set(ytrue) | set(ypred)
-        classes.discard(None)
-        classes = sorted(classes)
+        labels = np.concatenate(
+            [np.asarray(ytrue, dtype=object), np.asarray(ypred, dtype=object)]
+        )
+        classes = list(np.unique(labels[labels != None]))
     else:
         classes = list(classes)
 
-    ytrue = [y if y is not None else missing for y in ytrue]
-    ypred = [y if y is not None else missing for y in ypred]
+    ytrue = _clean_labels(ytrue, missing)
+    ypred = _clean_labels(ypred, missing)
 
     return ytrue, ypred, classes
 
 
-def _compute_accuracy(ytrue, ypred, labels=None, weights=None):
-    if labels is not None:
-        labels = set(labels)
-        found = np.array(
-            [yt in labels or yp in labels for yt, yp in zip(ytrue, ypred)],
-            dtype=bool,
-        )
-        ytrue = ytrue[found]
-        ypred = ypred[found]
-        if weights is not None:
-            weights = weights[found]
+def _clean_labels(y, missing):
+    y = np.array(y, dtype=object)
+    y[y == None] = missing
+    return y
+
+
+def _parse_confs(confs):
+    if confs is None:
+        return None
+
+    # Missing confidences are stored as nan
+    return np.asarray(confs, dtype=np.float64)
+
+
+def _encode_labels(y, label_codes):
+    return np.fromiter(
+        (label_codes.setdefault(label, len(label_codes)) for label in y),
+        dtype=np.int64,
+        count=len(y),
+    )
+
+
+def _compute_accuracy(ytrue, ypred, weights=None):
+    # `ytrue` and `ypred` are label indexes, where -1 denotes an excluded label
+    found = (ytrue >= 0) | (ypred >= 0)
+    ytrue = ytrue[found]
+    ypred = ypred[found]
+    if weights is not None:
+        weights = weights[found]
 
     if ytrue.size > 0:
         scores = ytrue == ypred
@@ -429,13 +472,12 @@ def _compute_accuracy(ytrue, ypred, labels=None, weights=None):
     return accuracy
 
 
-def _compute_support(ytrue, labels=None, weights=None):
-    if labels is not None:
-        labels = set(labels)
-        found = np.array([y in labels for y in ytrue], dtype=bool)
-        ytrue = ytrue[found]
-        if weights is not None:
-            weights = weights[found]
+def _compute_support(ytrue, weights=None):
+    # `ytrue` are label indexes, where -1 denotes an excluded label
+    found = ytrue >= 0
+    ytrue = ytrue[found]
+    if weights is not None:
+        weights = weights[found]
 
     if weights is not None:
         support = np.sum(weights)
@@ -448,15 +490,15 @@ def _compute_support(ytrue, labels=None, weights=None):
 def _compute_confusion_matrix(
     ytrue,
     ypred,
-    labels,
+    num_labels,
     weights=None,
     ytrue_ids=None,
     ypred_ids=None,
     tabulate_ids=False,
 ):
+    # `ytrue` and `ypred` are label indexes, where -1 denotes an excluded label
     ytrue = np.asarray(ytrue).flatten()
     ypred = np.asarray(ypred).flatten()
-    labels = np.asarray(labels)
 
     if weights is None:
         weights = np.ones(ytrue.size, dtype=int)
@@ -468,8 +510,6 @@ def _compute_confusion_matrix(
     else:
         dtype = np.float64
 
-    num_labels = labels.size
-
     confusion_matrix = np.zeros((num_labels, num_labels), dtype=dtype)
 
     if tabulate_ids:
@@ -485,15 +525,24 @@ def _compute_confusion_matrix(
     if num_labels == 0 or ytrue.size == 0:
         return confusion_matrix, ids
 
-    labels_to_inds = {label: idx for idx, label in enumerate(labels)}
-    ypred = np.array([labels_to_inds.get(y, -1) for y in ypred])
-    ytrue = np.array([labels_to_inds.get(y, -1) for y in ytrue])
-
     found = np.logical_and(ypred >= 0, ytrue >= 0)
     ypred = ypred[found]
     ytrue = ytrue[found]
     weights = weights[found]
 
+    confusion_matrix = (
+        np.bincount(
+            num_labels * ytrue + ypred,
+            weights=weights,
+            minlength=num_labels * num_labels,
+        )
+        .reshape(num_labels, num_labels)
+        .astype(dtype)
+    )
+
+    if not tabulate_ids:
+        return confusion_matrix, ids
+
     if ytrue_ids is not None:
         ytrue_ids = ytrue_ids[found]
     else:
@@ -504,9 +553,7 @@ def _compute_confusion_matrix(
     else:
         ypred_ids = itertools.repeat(None)
 
-    for yt, yp, w, it, ip in zip(ytrue, ypred, weights, ytrue_ids, ypred_ids):
-        confusion_matrix[yt, yp] += w
-
+    for yt, yp, it, ip in zip(ytrue, ypred, ytrue_ids, ypred_ids):
         if it is not None:
             ids[yt, yp].append(it)
 
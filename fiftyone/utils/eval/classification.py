@@ -16,6 +16,7 @@ import sklearn.metrics as skm
 import eta.core.utils as etau
 
 import fiftyone as fo
+import fiftyone.core.dataset as fod
 import fiftyone.core.evaluation as foe
 from fiftyone.core.expressions import ViewField as F
 import fiftyone.core.fields as fof
@@ -67,6 +68,11 @@ def evaluate_classifications(
         sample that records the average accuracy of the frame predictions of
         the sample.
 
+    If you only need the ``eval_key`` fields, you can pass
+    ``only_write_eval=True`` with the ``"simple"`` method to compute them
+    entirely in the database, without loading any labels into memory. In this
+    case, no :class:`ClassificationResults` are generated.
+
     Args:
         samples: a :class:`fiftyone.core.collections.SampleCollection`
         pred_field: the name of the field containing the predicted
@@ -89,7 +95,7 @@ def evaluate_classifications(
             :class:`ClassificationEvaluationConfig` being used
 
     Returns:
-        a :class:`ClassificationResults`
+        a :class:`ClassificationResults`, or None if ``only_write_eval=True``
     """
     fov.validate_non_grouped_collection(samples)
     fov.validate_collection_label_fields(
@@ -230,8 +236,16 @@ class SimpleEvaluationConfig(ClassificationEvaluationConfig):
             :class:`fiftyone.core.labels.Classification` instances
         gt_field: the name of the field containing the ground truth
             :class:`fiftyone.core.labels.Classification` instances
+        only_write_eval (False): whether to only populate the ``eval_key``
+            fields of the collection via a database-side comparison, without
+            loading any labels or generating :class:`ClassificationResults`.
+            Requires an ``eval_key``
     """
 
+    def __init__(self, pred_field, gt_field, only_write_eval=False, **kwargs):
+        super().__init__(pred_field, gt_field, **kwargs)
+        self.only_write_eval = only_write_eval
+
     @property
     def method(self):
         return "simple"
@@ -280,6 +294,15 @@ class SimpleEvaluation(ClassificationEvaluation):
         pred_id = pred_field + ".id"
         pred_conf = pred_field + ".confidence"
 
+        if self.config.only_write_eval:
+            if eval_key is None:
+                raise ValueError(
+                    "An `eval_key` is required when `only_write_eval=True`"
+                )
+
+            self._write_eval_fields(samples, eval_key, gt, pred)
+            return None
+
         ytrue, ytrue_ids, ypred, ypred_ids, confs = samples.values(
             [gt, gt_id, pred, pred_id, pred_conf]
         )
@@ -305,10 +328,13 @@ class SimpleEvaluation(ClassificationEvaluation):
             backend=self,
         )
 
-        if eval_key is None:
-            return results
+        if eval_key is not None:
+            self._write_eval_fields(samples, eval_key, gt, pred)
 
-        if is_frame_field:
+        return results
+
+    def _write_eval_fields(self, samples, eval_key, gt, pred):
+        if samples._is_frame_field(self.config.gt_field):
             eval_frame = samples._FRAMES_PREFIX + eval_key
             gt = gt[len(samples._FRAMES_PREFIX) :]
             pred = pred[len(samples._FRAMES_PREFIX) :]
@@ -321,11 +347,22 @@ class SimpleEvaluation(ClassificationEvaluation):
 
             # Per-frame accuracies
             samples.set_field(eval_frame, F(gt) == F(pred)).save(eval_frame)
+        elif isinstance(samples, fod.Dataset):
+            # Per-sample accuracies
+            _update_eq_field(samples, eval_key, gt, pred)
         else:
             # Per-sample accuracies
             samples.set_field(eval_key, F(gt) == F(pred)).save(eval_key)
 
-        return results
+
+def _update_eq_field(dataset, eval_key, gt, pred):
+    # Writes `gt == pred` to `eval_key` via a single in-place update, which
+    # avoids the extra passes that saving a view requires
+    eval_key, gt, pred = dataset._handle_db_fields([eval_key, gt, pred])
+    dataset._sample_collection.update_many(
+        {}, [{"$set": {eval_key: {"$eq": ["$" + gt, "$" + pred]}}}]
+    )
+    dataset._reload_docs()
 
 
 class TopKEvaluationConfig(ClassificationEvaluationConfig):
@@ -408,7 +445,7 @@ class TopKEvaluation(ClassificationEvaluation):
             ]
         )
 
-        targets_map = {label: idx for idx, label in enumerate(classes)}
+        targets_map = _make_targets_map(classes)
 
         if is_frame_field:
             confs = []
@@ -451,11 +488,11 @@ class TopKEvaluation(ClassificationEvaluation):
             eval_frame = samples._FRAMES_PREFIX + eval_key
 
             # Sample-level accuracies
-            avg_accuracies = [np.mean(c) if c else None for c in correct]
+            avg_accuracies = [np.mean(c) if c.size else None for c in correct]
             samples.set_values(eval_key, avg_accuracies)
 
             # Per-frame accuracies
-            samples.set_values(eval_frame, correct)
+            samples.set_values(eval_frame, [c.tolist() for c in correct])
         else:
             # Per-sample accuracies
             samples.set_values(eval_key, correct)
@@ -464,14 +501,15 @@ class TopKEvaluation(ClassificationEvaluation):
 
 
 def _evaluate_top_k(ytrue, ypred, logits, k, targets_map):
-    confs = []
-    correct = []
+    num_samples = len(ytrue)
+    confs = [None] * num_samples
+    correct = np.zeros(num_samples, dtype=bool)
+
+    valid = []
     for idx, (_ytrue, _logits) in enumerate(zip(ytrue, logits)):
         if _logits is None:
             # No logits; no prediction
             ypred[idx] = None
-            _conf = None
-            _correct = False
             msg = (
                 "Found sample(s) with no logits. Logits are required to "
                 + "compute top-k accuracy"
@@ -479,55 +517,103 @@ def _evaluate_top_k(ytrue, ypred, logits, k, targets_map):
             warnings.warn(msg)
         elif _ytrue is None:
             # Missing ground truth
-            _correct = ypred[idx] is None
-            _conf = None
+            correct[idx] = ypred[idx] is None
         else:
-            try:
-                target = targets_map[_ytrue]
-            except KeyError:
-                raise ValueError(
-                    "Found ground truth label '%s' not in provided classes"
-                    % _ytrue
-                )
+            valid.append(idx)
+
+    if not valid:
+        return confs, correct
+
+    targets = _get_class_inds(
+        [ytrue[idx] for idx in valid], targets_map, "ground truth"
+    )
+
+    # Stack logits into a `num_valid x num_classes` array. Ragged logits are
+    # padded with `-inf`, which never enter the top-k of a row that has at
+    # least k finite values and contribute nothing to the softmax
+    lengths = np.array([len(logits[i]) for i in valid], dtype=np.int64)
+    num_cols = lengths.max()
+    if (lengths == num_cols).all():
+        _logits = np.asarray([logits[i] for i in valid], dtype=np.float64)
+    else:
+        _logits = np.full((len(valid), num_cols), -np.inf)
+        for row, idx in enumerate(valid):
+            _logits[row, : lengths[row]] = logits[idx]
+
+    rows = np.arange(len(valid))
+    target_logits = _logits[rows, targets]
+
+    if k >= num_cols:
+        found = np.ones(len(valid), dtype=bool)
+    else:
+        # The target is in the top-k iff it is at least the kth largest
+        # logit, so no top-k index arrays need to be materialized
+        kth_logits = np.partition(_logits, -k, axis=1)[:, -k]
+        found = target_logits >= kth_logits
+
+        found |= lengths <= k
+
+    # Truth is in top-k; use it
+    logit = target_logits.copy()
+
+    # Truth is not in top-k; retain actual prediction, if any
+    not_found = np.flatnonzero(~found)
+    has_pred = np.array(
+        [ypred[valid[row]] is not None for row in not_found], dtype=bool
+    )
+    pred_rows = not_found[has_pred]
+    if pred_rows.size > 0:
+        pred_inds = _get_class_inds(
+            [ypred[valid[row]] for row in pred_rows], targets_map, "predicted"
+        )
+        logit[pred_rows] = _logits[pred_rows, pred_inds]
 
-            if k >= len(_logits):
-                found = True
-            else:
-                top_k = np.argpartition(_logits, -k)[-k:]
-                found = target in top_k
-
-            if found:
-                # Truth is in top-k; use it
-                ypred[idx] = _ytrue
-                logit = _logits[target]
-                _correct = True
-            elif ypred[idx] is not None:
-                # Truth is not in top-k; retain actual prediction
-                _ypred = ypred[idx]
-
-                try:
-                    _pred_idx = targets_map[_ypred]
-                except KeyError:
-                    raise ValueError(
-                        "Found predicted label '%s' not in provided classes"
-                        % _ypred
-                    )
-
-                logit = _logits[_pred_idx]
-                _correct = False
-            else:
-                # Missing prediction
-                logit = -np.inf
-                _correct = False
-
-            _conf = np.exp(logit) / np.sum(np.exp(_logits))
-
-        confs.append(_conf)
-        correct.append(_correct)
+    # Missing prediction
+    logit[not_found[~has_pred]] = -np.inf
+
+    _confs = np.exp(logit) / np.sum(np.exp(_logits), axis=1)
+
+    for row, idx in enumerate(valid):
+        if found[row]:
+            ypred[idx] = ytrue[idx]
+
+        confs[idx] = _confs[row]
+
+    correct[valid] = found
 
     return confs, correct
 
 
+def _make_targets_map(classes):
+    # A sorted copy of `classes` and the permutation that maps it back to
+    # class indexes. A stable sort ensures that duplicate classes resolve to
+    # their last index, just like a `{label: idx}` dict would
+    classes = np.asarray(classes)
+    order = np.argsort(classes, kind="stable")
+    return classes[order], order
+
+
+def _get_class_inds(labels, targets_map, label_type):
+    sorted_classes, order = targets_map
+    labels = np.asarray(labels)
+
+    if sorted_classes.size > 0:
+        inds = np.searchsorted(sorted_classes, labels, side="right") - 1
+        inds = np.maximum(inds, 0)
+        valid = sorted_classes[inds] == labels
+    else:
+        inds = np.zeros(labels.size, dtype=np.int64)
+        valid = np.zeros(labels.size, dtype=bool)
+
+    if not valid.all():
+        label = labels[np.argmin(valid)]
+        raise ValueError(
+            "Found %s label '%s' not in provided classes" % (label_type, label)
+        )
+
+    return order[inds]
+
+
 class BinaryEvaluationConfig(ClassificationEvaluationConfig):
     """Binary evaluation config.
 
@@ -611,6 +697,9 @@ class BinaryEvaluation(ClassificationEvaluation):
         )
 
         if is_frame_field:
+            frame_ytrue = ytrue
+            frame_ypred = ypred
+
             ytrue = list(itertools.chain.from_iterable(ytrue))
             ytrue_ids = list(itertools.chain.from_iterable(ytrue_ids))
             ypred = list(itertools.chain.from_iterable(ypred))
@@ -649,31 +738,16 @@ class BinaryEvaluation(ClassificationEvaluation):
 
             # Per-frame accuracies
             # This implementation implicitly treats missing data as `neg_label`
-            samples.set_field(
-                eval_frame,
-                F().switch(
-                    {
-                        (F(gt) == pos_label) & (F(pred) == pos_label): "TP",
-                        (F(gt) == pos_label) & (F(pred) != pos_label): "FN",
-                        (F(gt) != pos_label) & (F(pred) != pos_label): "TN",
-                        (F(gt) != pos_label) & (F(pred) == pos_label): "FP",
-                    }
-                ),
-            ).save(eval_frame)
+            status = [
+                _to_binary_status(_ytrue, _ypred, pos_label).tolist()
+                for _ytrue, _ypred in zip(frame_ytrue, frame_ypred)
+            ]
+            samples.set_values(eval_frame, status)
         else:
             # Per-sample accuracies
             # This implementation implicitly treats missing data as `neg_label`
-            samples.set_field(
-                eval_key,
-                F().switch(
-                    {
-                        (F(gt) == pos_label) & (F(pred) == pos_label): "TP",
-                        (F(gt) == pos_label) & (F(pred) != pos_label): "FN",
-                        (F(gt) != pos_label) & (F(pred) != pos_label): "TN",
-                        (F(gt) != pos_label) & (F(pred) == pos_label): "FP",
-                    }
-                ),
-            ).save(eval_key)
+            status = _to_binary_status(ytrue, ypred, pos_label)
+            samples.set_values(eval_key, status)
 
         return results
 
@@ -751,10 +825,13 @@ class BinaryClassificationResults(ClassificationResults):
         )
 
         self._pos_label = classes[1]
-        self.scores = np.asarray(
-            _to_binary_scores(ypred, confs, self._pos_label)
+        self.scores = _to_binary_scores(
+            self.ypred, self.confs, self._pos_label
         )
 
+        # Boolean ground truth enables sklearn's fast numeric code paths
+        self._ytrue_bool = self.ytrue == self._pos_label
+
     def average_precision(self, average="micro"):
         """Computes the average precision for the results via
         :func:`sklearn:sklearn.metrics.average_precision_score`.
@@ -766,9 +843,9 @@ class BinaryClassificationResults(ClassificationResults):
             the average precision
         """
         return skm.average_precision_score(
-            self.ytrue,
+            self._ytrue_bool,
             self.scores,
-            pos_label=self._pos_label,
+            pos_label=True,
             average=average,
             sample_weight=self.weights,
         )
@@ -795,9 +872,9 @@ class BinaryClassificationResults(ClassificationResults):
             -   a plotly or matplotlib figure, otherwise
         """
         precision, recall, thresholds = skm.precision_recall_curve(
-            self.ytrue,
+            self._ytrue_bool,
             self.scores,
-            pos_label=self._pos_label,
+            pos_label=True,
             sample_weight=self.weights,
         )
         thresholds = np.concatenate([thresholds, [max(1, thresholds[-1])]])
@@ -834,9 +911,9 @@ class BinaryClassificationResults(ClassificationResults):
             -   a plotly or matplotlib figure, otherwise
         """
         fpr, tpr, thresholds = skm.roc_curve(
-            self.ytrue,
+            self._ytrue_bool,
             self.scores,
-            pos_label=self._pos_label,
+            pos_label=True,
             sample_weight=self.weights,
         )
         thresholds[0] = max(1, thresholds[1])
@@ -916,13 +993,19 @@ def _parse_config(pred_field, gt_field, method, **kwargs):
     return config_cls(pred_field, gt_field, **params)
 
 
+_BINARY_STATUS = np.array([["TN", "FP"], ["FN", "TP"]], dtype=object)
+
+
+def _to_binary_status(ytrue, ypred, pos_label):
+    gt_pos = np.asarray(ytrue, dtype=object) == pos_label
+    pred_pos = np.asarray(ypred, dtype=object) == pos_label
+    return _BINARY_STATUS[gt_pos.astype(int), pred_pos.astype(int)]
+
+
 def _to_binary_scores(y, confs, pos_label):
-    scores = []
-    for yi, conf in zip(y, confs):
-        if conf is None:
-            conf = 0.0
+    y = np.asarray(y, dtype=object)
 
-        score = conf if yi == pos_label else 1.0 - conf
-        scores.append(score)
+    # Missing confidences (`None -> nan`) are treated as zero confidence
+    confs = np.nan_to_num(np.asarray(confs, dtype=np.float64), nan=0.0)
 
-    return scores
+    return np.where(y == pos_label, confs, 1.0 - confs)
@@ -429,6 +429,47 @@ class ClassificationTests(unittest.TestCase):
         self.assertNotIn("eval2", dataset.list_evaluations())
         self.assertNotIn("eval2", dataset.get_field_schema())
 
+    @drop_datasets
+    def test_evaluate_classifications_only_write_eval(self):
+        dataset = self._make_classification_dataset()
+
+        with self.assertRaises(ValueError):
+            dataset.evaluate_classifications(
+                "predictions",
+                gt_field="ground_truth",
+                method="simple",
+                only_write_eval=True,
+            )
+
+        results = dataset.evaluate_classifications(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval",
+            method="simple",
+            only_write_eval=True,
+        )
+
+        self.assertIsNone(results)
+        self.assertIn("eval", dataset.list_evaluations())
+        self.assertListEqual(
+            dataset.values("eval"),
+            [True, False, False, True, False],
+        )
+
+        view = dataset.limit(3)
+        view.evaluate_classifications(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval2",
+            method="simple",
+            only_write_eval=True,
+        )
+
+        self.assertListEqual(
+            dataset.values("eval2"),
+            [True, False, False, None, None],
+        )
+
     @drop_datasets
     def test_evaluate_classifications_top_k(self):
         dataset = self._make_classification_dataset()
@@ -541,6 +582,66 @@ class ClassificationTests(unittest.TestCase):
             [False, False, False, True, False],
         )
 
+    @drop_datasets
+    def test_evaluate_classifications_top_k_matching(self):
+        dataset = fo.Dataset()
+
+        # (ground truth, prediction, logits)
+        data = [
+            # truth is the top-1
+            ("cat", "cat", [2.0, 1.0, 0.0]),
+            # truth not in top-1, so the prediction is retained
+            ("cat", "dog", [0.0, 2.0, 1.0]),
+            # truth is the top-1, so it replaces the prediction
+            ("dog", "cat", [1.0, 2.0, 0.0]),
+            # ragged logits, truth is the top-1
+            ("dog", "dog", [0.0, 1.0]),
+            # ragged logits, truth not in top-1
+            ("cat", "dog", [0.0, 1.0]),
+            # truth is tied with the top-1 logit, which counts as a match
+            ("cat", "dog", [1.0, 1.0, 0.0]),
+        ]
+
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    ground_truth=fo.Classification(label=gt),
+                    predictions=fo.Classification(label=pred, logits=logits),
+                )
+                for i, (gt, pred, logits) in enumerate(data)
+            ]
+        )
+
+        results = dataset.evaluate_classifications(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval",
+            classes=["cat", "dog", "bird"],
+            method="top-k",
+            k=1,
+        )
+
+        self.assertListEqual(
+            dataset.values("eval"),
+            [True, False, True, True, False, True],
+        )
+        self.assertListEqual(
+            list(results.ypred),
+            ["cat", "dog", "dog", "dog", "dog", "cat"],
+        )
+
+        e = np.exp
+        expected = [
+            e(2) / (e(2) + e(1) + e(0)),
+            e(2) / (e(0) + e(2) + e(1)),
+            e(2) / (e(1) + e(2) + e(0)),
+            e(1) / (e(0) + e(1)),
+            e(1) / (e(0) + e(1)),
+            e(1) / (e(1) + e(1) + e(0)),
+        ]
+        self.assertTrue(np.allclose(results.confs, expected))
+
     @drop_datasets
     def test_evaluate_classifications_binary(self):
         dataset = self._make_classification_dataset()
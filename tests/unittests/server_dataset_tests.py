@@ -0,0 +1,220 @@
+"""
+FiftyOne Server dataset tests.
+
+| Copyright 2017-2024, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+
+import re
+import typing as t
+import unittest
+
+import strawberry as gql
+
+import fiftyone as fo
+import fiftyone.core.brain as fob
+
+from fiftyone.server.constants import SCALAR_OVERRIDES
+from fiftyone.server.paginator import Connection, get_paginator_resolver
+from fiftyone.server.query import (
+    Dataset,
+    DATASET_FILTER_STAGE,
+    dataset_dataloader,
+)
+
+from decorators import drop_async_dataset
+from utils.graphql import execute
+
+
+@gql.type
+class DatasetsQuery:
+    dataset: Dataset = gql.field(resolver=Dataset.resolver)
+    dataset_by_name: t.Optional[Dataset] = gql.field(
+        resolver=dataset_dataloader
+    )
+    datasets: Connection[Dataset, str] = gql.field(
+        resolver=get_paginator_resolver(
+            Dataset, "created_at", DATASET_FILTER_STAGE, "datasets"
+        )
+    )
+
+
+schema = gql.Schema(query=DatasetsQuery, scalar_overrides=SCALAR_OVERRIDES)
+
+
+def _add_runs(dataset):
+    dataset.add_sample(
+        fo.Sample(
+            filepath="image.jpg",
+            ground_truth=fo.Classification(label="cat"),
+            predictions=fo.Classification(label="cat"),
+        )
+    )
+
+    brain_method = fob.BrainMethod(fob.BrainMethodConfig())
+    brain_method.register_run(dataset, "brain")
+
+    dataset.evaluate_classifications(
+        "predictions", gt_field="ground_truth", eval_key="eval"
+    )
+
+
+class ServerDatasetRunsTests(unittest.IsolatedAsyncioTestCase):
+    @drop_async_dataset
+    async def test_dataset_runs(self, dataset: fo.Dataset):
+        _add_runs(dataset)
+
+        query = """
+            query Query($name: String!) {
+                dataset(name: $name) {
+                    brainMethods {
+                        key
+                    }
+                    evaluations {
+                        key
+                    }
+                }
+            }
+        """
+
+        result = await execute(schema, query, {"name": dataset.name})
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            result.data,
+            {
+                "dataset": {
+                    "brainMethods": [{"key": "brain"}],
+                    "evaluations": [{"key": "eval"}],
+                }
+            },
+        )
+
+    @drop_async_dataset
+    async def test_datasets_runs(self, dataset: fo.Dataset):
+        _add_runs(dataset)
+
+        query = """
+            query Query($search: String!) {
+                datasets(search: $search) {
+                    edges {
+                        node {
+                            brainMethods {
+                                key
+                            }
+                            evaluations {
+                                key
+                            }
+                        }
+                    }
+                }
+            }
+        """
+
+        result = await execute(
+            schema, query, {"search": "^%s$" % re.escape(dataset.name)}
+        )
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            result.data,
+            {
+                "datasets": {
+                    "edges": [
+                        {
+                            "node": {
+                                "brainMethods": [{"key": "brain"}],
+                                "evaluations": [{"key": "eval"}],
+                            }
+                        }
+                    ]
+                }
+            },
+        )
+
+
+class ServerDatasetSelectionTests(unittest.IsolatedAsyncioTestCase):
+    async def _query_datasets(self, dataset, selection, fragments=""):
+        query = """
+            query Query($search: String!) {
+                datasets(search: $search) {
+                    edges {
+                        node {
+                            %s
+                        }
+                    }
+                }
+            }
+            %s
+        """ % (
+            selection,
+            fragments,
+        )
+
+        result = await execute(
+            schema, query, {"search": "^%s$" % re.escape(dataset.name)}
+        )
+        self.assertIsNone(result.errors)
+        return result.data["datasets"]["edges"][0]["node"]
+
+    @drop_async_dataset
+    async def test_datasets_selection(self, dataset: fo.Dataset):
+        node = await self._query_datasets(dataset, "name")
+        self.assertEqual(node, {"name": dataset.name})
+
+        node = await self._query_datasets(
+            dataset, "name sampleFields { path }"
+        )
+        self.assertEqual(node["name"], dataset.name)
+        paths = [f["path"] for f in node["sampleFields"]]
+        self.assertIn("filepath", paths)
+
+        node = await self._query_datasets(
+            dataset,
+            "name ...DatasetFields",
+            fragments="""
+                fragment DatasetFields on Dataset {
+                    sampleFields {
+                        path
+                    }
+                    frameFields {
+                        path
+                    }
+                }
+            """,
+        )
+        paths = [f["path"] for f in node["sampleFields"]]
+        self.assertIn("filepath", paths)
+        self.assertEqual(node["frameFields"], [])
+
+        node = await self._query_datasets(
+            dataset, "name ... on Dataset { sampleFields { path } }"
+        )
+        paths = [f["path"] for f in node["sampleFields"]]
+        self.assertIn("filepath", paths)
+
+    @drop_async_dataset
+    async def test_dataloader_selection(self, dataset: fo.Dataset):
+        # The same dataset is batch-loaded twice with different selections
+        query = """
+            query Query($name: String!) {
+                a: datasetByName(name: $name) {
+                    name
+                }
+                b: datasetByName(name: $name) {
+                    name
+                    sampleFields {
+                        path
+                    }
+                }
+            }
+        """
+
+        result = await execute(schema, query, {"name": dataset.name})
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.data["a"], {"name": dataset.name})
+        self.assertEqual(result.data["b"]["name"], dataset.name)
+        paths = [f["path"] for f in result.data["b"]["sampleFields"]]
+        self.assertIn("filepath", paths)
@@ -902,3 +902,25 @@ class ServerDocTests(unittest.TestCase):
         doc = Dataset.modifier({"_id": "id"})
         self.assertIn("frame_collection_name", doc)
         self.assertEqual(doc["frame_collection_name"], None)
+
+    def test_dataset_doc_fields(self):
+        fields = [
+            {
+                "name": "ground_truth",
+                "ftype": "fiftyone.core.fields.EmbeddedDocumentField",
+                "fields": [
+                    {
+                        "name": "label",
+                        "ftype": "fiftyone.core.fields.StringField",
+                    }
+                ],
+            }
+        ]
+        doc = Dataset.modifier({"_id": "id", "sample_fields": fields})
+
+        # Field docs are retained as-is until their schema is resolved
+        self.assertNotIn("sample_fields", doc)
+        self.assertEqual(doc["sample_field_docs"], fields)
+        self.assertEqual(doc["frame_field_docs"], [])
+        self.assertIsNone(doc["sample_field_schema"])
+        self.assertIsNone(doc["frame_field_schema"])
@@ -873,6 +873,31 @@ class SetValuesTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.dataset.set_values("str_field", values, key_field="int_field")
 
+    def test_set_values_numpy(self):
+        values = np.array([True, False, True, False])
+        self.dataset.set_values("bool_field", values)
+        self.assertListEqual(
+            self.dataset.values("bool_field"), [True, False, True, False]
+        )
+        self.assertIsInstance(
+            self.dataset.get_field("bool_field"), fo.BooleanField
+        )
+
+        values = np.arange(4, dtype=np.int8)
+        self.dataset.set_values("int_field", values)
+        self.assertListEqual(self.dataset.values("int_field"), [0, 1, 2, 3])
+
+        values = np.random.randn(4, 8)
+        self.dataset.set_values("vector_field", values)
+        self.assertIsInstance(
+            self.dataset.get_field("vector_field"), fo.VectorField
+        )
+
+        values2 = self.dataset.values("vector_field")
+        for value, value2 in zip(values, values2):
+            self.assertIsInstance(value2, np.ndarray)
+            self.assertTrue(np.allclose(value, value2))
+
     def test_set_values_frames_dicts(self):
         dataset = fo.Dataset()
         dataset.add_samples(